@@ -7,10 +7,32 @@ DailyInputCounter 配置管理模块
 import os
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# orjson是可选的加速依赖，首次解析时才尝试导入（False表示尚未探测）
+_orjson = False
+
+
+def _json_loads(data: bytes) -> Dict[str, Any]:
+    """解析配置JSON字节串（优先orjson，回退标准库）"""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+# 窗口几何默认值 - 模块级常量，__post_init__浅拷贝复用，不重复构造字面量
+_DEFAULT_WINDOW_POSITION = {"x": 100, "y": 100}
+_DEFAULT_WINDOW_SIZE = {"width": 800, "height": 600}
+
 
 @dataclass
 class Settings:
@@ -28,6 +50,7 @@ class Settings:
     window_size: Dict[str, int] = None
     
     # 统计设置
+    # 与core.character_analyzer中预编译的CHINESE_RANGE/ENGLISH_RANGES保持一致
     chinese_char_range: str = "\\u4e00-\\u9fff"  # 中文字符Unicode范围
     english_char_range: str = "a-zA-Z"  # 英文字符范围
     count_numbers: bool = False  # 是否统计数字
@@ -42,9 +65,13 @@ class Settings:
     def __post_init__(self):
         """初始化后处理"""
         if self.window_position is None:
-            self.window_position = {"x": 100, "y": 100}
+            self.window_position = dict(_DEFAULT_WINDOW_POSITION)
         if self.window_size is None:
-            self.window_size = {"width": 800, "height": 600}
+            self.window_size = dict(_DEFAULT_WINDOW_SIZE)
+
+
+# 配置项字段名集合 - 类定义后计算一次，避免每次校验都遍历__dataclass_fields__
+_SETTINGS_FIELDS = frozenset(Settings.__dataclass_fields__)
 
 
 class ConfigManager:
@@ -79,6 +106,12 @@ class ConfigManager:
         
         # 加载配置
         self.settings = self.load_config()
+
+        # 数据目录路径缓存（data_path变化时失效）
+        self._data_path: Optional[Path] = None
+
+        # 数据目录已创建标记 - 首次确保后不再重复mkdir
+        self._data_dir_ready = False
     
     def load_config(self) -> Settings:
         """
@@ -89,15 +122,15 @@ class ConfigManager:
         """
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                
+                # 一次性读入字节串再解析，避免文本层逐块解码的开销
+                config_data = _json_loads(self.config_file.read_bytes())
+
                 # 创建Settings对象
                 settings = Settings()
                 
                 # 更新配置值
                 for key, value in config_data.items():
-                    if hasattr(settings, key):
+                    if key in _SETTINGS_FIELDS:
                         setattr(settings, key, value)
                     else:
                         self.logger.warning(f"未知配置项: {key}")
@@ -121,11 +154,9 @@ class ConfigManager:
             bool: 保存是否成功
         """
         try:
-            # 转换为字典
-            config_data = {}
-            for field in self.settings.__dataclass_fields__:
-                config_data[field] = getattr(self.settings, field)
-            
+            # 一次性转换为字典
+            config_data = asdict(self.settings)
+
             # 写入文件
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, indent=4, ensure_ascii=False)
@@ -161,43 +192,57 @@ class ConfigManager:
         Returns:
             bool: 设置是否成功
         """
-        if hasattr(self.settings, key):
+        if key in _SETTINGS_FIELDS:
             setattr(self.settings, key, value)
+            if key == 'data_path':
+                self._data_path = None
+                self._data_dir_ready = False
             return True
         else:
             self.logger.warning(f"无效的配置项: {key}")
             return False
-    
+
     def reset_to_default(self) -> None:
         """重置为默认配置"""
         self.settings = Settings()
+        self._data_path = None
+        self._data_dir_ready = False
         self.logger.info("配置已重置为默认值")
-    
+
     def get_data_path(self) -> Path:
-        """获取数据目录路径"""
-        data_path = Path(self.settings.data_path)
-        if not data_path.is_absolute():
-            data_path = Path.cwd() / data_path
-        return data_path
+        """获取数据目录路径（结果缓存，data_path变化时重新计算）"""
+        if self._data_path is None:
+            data_path = Path(self.settings.data_path)
+            if not data_path.is_absolute():
+                data_path = Path.cwd() / data_path
+            self._data_path = data_path
+        return self._data_path
     
     def ensure_data_directory(self) -> bool:
-        """确保数据目录存在"""
+        """确保数据目录存在（首次成功后只检查标记，不再触发mkdir系统调用）"""
+        if self._data_dir_ready:
+            return True
+
         try:
             data_path = self.get_data_path()
             data_path.mkdir(parents=True, exist_ok=True)
+            self._data_dir_ready = True
             return True
         except Exception as e:
             self.logger.error(f"创建数据目录失败: {e}")
             return False
 
 
-# 全局配置管理器实例
-config_manager = ConfigManager()
+# 全局配置管理器实例（延迟创建，避免import时就读配置文件、建目录）
+_config_manager: Optional[ConfigManager] = None
 
 def get_config() -> ConfigManager:
-    """获取全局配置管理器实例"""
-    return config_manager
+    """获取全局配置管理器实例（首次调用时创建）"""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
 
 def get_settings() -> Settings:
     """获取当前设置对象"""
-    return config_manager.settings 
\ No newline at end of file
+    return get_config().settings 
\ No newline at end of file
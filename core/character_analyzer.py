@@ -9,19 +9,128 @@ Character Analyzer - 字符分析器
 版本：1.0.0-mvp
 """
 
-import re
 import logging
 
+# numpy是可选的加速依赖，首次批量分析时才尝试导入（False表示尚未探测），
+# 避免模块导入阶段就承担numpy的加载开销
+np = False
+
+
+def _load_numpy():
+    """探测并缓存numpy模块，缺失时回退到纯Python实现"""
+    global np
+    if np is False:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+    return np
+
+
+# 翻译表：码点 -> 分类哨兵字符，配合str.translate+str.count实现C级批量计数
+# （首次使用时构建，约2万条目；作为numpy缺失时的长文本快速路径）
+_SENTINEL_CN = '\x01'
+_SENTINEL_EN = '\x02'
+_translate_table = None
+
+
+def _load_translate_table():
+    """构建并缓存分类翻译表"""
+    global _translate_table
+    if _translate_table is None:
+        # 哨兵字符是带内信号：输入里预先存在的U+0001/U+0002（pynput会把
+        # Ctrl+A/Ctrl+B上报为这两个字符）必须改写成中立字符，
+        # 否则会被误计入中文/英文
+        table = {0x01: '\x00', 0x02: '\x00'}
+        for low, high in CHINESE_RANGES:
+            for code in range(low, high + 1):
+                table[code] = _SENTINEL_CN
+        for low, high in ENGLISH_RANGES:
+            for code in range(low, high + 1):
+                table[code] = _SENTINEL_EN
+        _translate_table = table
+    return _translate_table
+
+
 logger = logging.getLogger(__name__)
 
+# 批量分析时启用numpy向量化的最小文本长度（短文本走标量路径，避免数组构造开销）
+# 公开常量：键盘监听器的批处理大小与之对齐，保证整批都走向量化路径
+VECTORIZE_THRESHOLD = 32
+
+# 分类结果常量 - 模块级驻留，避免每次分类都新建小字符串对象
+_CHINESE = 'chinese'
+_ENGLISH = 'english'
+_OTHER = 'other'
+
+# 预编译的码点区间（整数闭区间）- 单字符与批量路径共用，
+# 与config.settings中chinese_char_range/english_char_range的默认值保持一致。
+# 中文覆盖基本区之外，还包括扩展A区与兼容汉字区
+CHINESE_RANGES = (
+    (0x4E00, 0x9FFF),   # CJK统一汉字基本区（绝大多数输入）
+    (0x3400, 0x4DBF),   # CJK扩展A区
+    (0xF900, 0xFAFF),   # CJK兼容汉字
+)
+ENGLISH_RANGES = ((0x41, 0x5A), (0x61, 0x7A))
+
+# 热路径上直接比较的标量边界（从上面的区间解包一次，基本区排最前）
+(_CN_LO, _CN_HI), (_EXTA_LO, _EXTA_HI), (_COMPAT_LO, _COMPAT_HI) = CHINESE_RANGES
+(_UPPER_LO, _UPPER_HI), (_LOWER_LO, _LOWER_HI) = ENGLISH_RANGES
+
+# Latin-1分类表：码点直接索引bytes得到类别编号，再映射回类别字符串。
+# 键盘输入绝大多数是ASCII，单次索引比多个区间比较更快；
+# 表覆盖到256，Latin-1补充区（全是other）也无需走缓存分支
+_CLASS_NAMES = (_OTHER, _CHINESE, _ENGLISH)
+_ASCII_CLASS = bytes(
+    2 if (_UPPER_LO <= code <= _UPPER_HI or _LOWER_LO <= code <= _LOWER_HI)
+    else 0
+    for code in range(256)
+)
+
+
+# 两级页表：码点右移10位定位到1024码点一页的页分类表。
+# 整页同质（全中文/全其他）的页一次查表定论，只有区间边界所在的
+# 少数几页需要再做区间比较——常数两次内存访问，表共1088字节，常驻L1
+_PAGE_SHIFT = 10
+_PAGE_COUNT = 0x110000 >> _PAGE_SHIFT
+
+
+def _build_page_table():
+    """根据CHINESE_RANGES生成页分类表（0=整页other, 1=整页chinese, 2=跨界页）"""
+    table = bytearray(_PAGE_COUNT)
+    page_size = 1 << _PAGE_SHIFT
+    for low, high in CHINESE_RANGES:
+        for page in range(low >> _PAGE_SHIFT, (high >> _PAGE_SHIFT) + 1):
+            page_lo = page << _PAGE_SHIFT
+            if low <= page_lo and page_lo + page_size - 1 <= high:
+                table[page] = 1
+            else:
+                table[page] = 2
+    return bytes(table)
+
+
+_PAGE_CLASS = _build_page_table()
+
+
+def _classify_non_ascii(code):
+    """非ASCII码点分类（两级页表，绝大多数码点一次查表定论）"""
+    kind = _PAGE_CLASS[code >> _PAGE_SHIFT]
+    if kind == 0:
+        return _OTHER
+    if kind == 1:
+        return _CHINESE
+    # 跨界页：退回区间比较（基本区最常见，排在最前）
+    if _CN_LO <= code <= _CN_HI or \
+            _EXTA_LO <= code <= _EXTA_HI or \
+            _COMPAT_LO <= code <= _COMPAT_HI:
+        return _CHINESE
+    return _OTHER
+
 
 class CharacterAnalyzer:
     """字符分析器 - MVP版本"""
     
-    # 字符分类正则表达式
-    CHINESE_PATTERN = re.compile(r'[\u4e00-\u9fff]')  # 中文汉字范围
-    ENGLISH_PATTERN = re.compile(r'[a-zA-Z]')         # 英文字母
-    
     def __init__(self):
         """初始化字符分析器"""
         logger.info("字符分析器初始化完成")
@@ -38,23 +147,16 @@ class CharacterAnalyzer:
             str: 字符类型 ('chinese', 'english', 'other')
         """
         if not char or len(char) != 1:
-            return 'other'
-        
-        try:
-            # 检查是否为中文字符
-            if CharacterAnalyzer.CHINESE_PATTERN.match(char):
-                return 'chinese'
-            
-            # 检查是否为英文字符
-            if CharacterAnalyzer.ENGLISH_PATTERN.match(char):
-                return 'english'
-            
-            # 其他字符（数字、符号等）
-            return 'other'
-            
-        except Exception as e:
-            logger.warning(f"字符分类异常 '{char}': {e}")
-            return 'other'
+            return _OTHER
+
+        code = ord(char)
+
+        # Latin-1快速路径：查表一次完成分类
+        if code < 256:
+            return _CLASS_NAMES[_ASCII_CLASS[code]]
+
+        # 更高码点走两级页表判定（整页同质的页一次查表定论）
+        return _classify_non_ascii(code)
     
     @staticmethod
     def analyze_text(text):
@@ -84,19 +186,46 @@ class CharacterAnalyzer:
         chinese_count = 0
         english_count = 0
         other_count = 0
-        
+
         try:
-            for char in text:
-                char_type = CharacterAnalyzer.classify_character(char)
-                if char_type == 'chinese':
-                    chinese_count += 1
-                elif char_type == 'english':
-                    english_count += 1
-                else:
-                    other_count += 1
-            
+            if len(text) >= VECTORIZE_THRESHOLD and _load_numpy() is not None:
+                # 向量化路径：将文本转为UTF-32码点数组，用布尔掩码做C级归约
+                codepoints = np.frombuffer(
+                    text.encode('utf-32-le'), dtype=np.uint32
+                )
+                chinese_mask = (codepoints >= _CN_LO) & (codepoints <= _CN_HI)
+                chinese_mask |= (codepoints >= _EXTA_LO) & (codepoints <= _EXTA_HI)
+                chinese_mask |= (codepoints >= _COMPAT_LO) & (codepoints <= _COMPAT_HI)
+                # count_nonzero对布尔数组比sum快（免去整数累加的类型提升）
+                chinese_count = int(np.count_nonzero(chinese_mask))
+                # 按位或0x20将大写字母折叠为小写，一次掩码同时覆盖大小写
+                folded = codepoints | 0x20
+                english_count = int(np.count_nonzero(
+                    (folded >= _LOWER_LO) & (folded <= _LOWER_HI)
+                ))
+                other_count = len(text) - chinese_count - english_count
+            elif len(text) >= VECTORIZE_THRESHOLD:
+                # 翻译表路径：numpy缺失时，translate+count同样全程在C层完成
+                translated = text.translate(_load_translate_table())
+                chinese_count = translated.count(_SENTINEL_CN)
+                english_count = translated.count(_SENTINEL_EN)
+                other_count = len(text) - chinese_count - english_count
+            else:
+                # 标量路径：短文本或numpy不可用时逐字符分类。
+                # 区间比较直接内联，省掉每字符一次的方法调用开销
+                for code in map(ord, text):
+                    if _CN_LO <= code <= _CN_HI or \
+                            _EXTA_LO <= code <= _EXTA_HI or \
+                            _COMPAT_LO <= code <= _COMPAT_HI:
+                        chinese_count += 1
+                    elif _UPPER_LO <= code <= _UPPER_HI or \
+                            _LOWER_LO <= code <= _LOWER_HI:
+                        english_count += 1
+                    else:
+                        other_count += 1
+
             total_count = chinese_count + english_count + other_count
-            
+
             result = {
                 'chinese_count': chinese_count,
                 'english_count': english_count,
@@ -104,7 +233,8 @@ class CharacterAnalyzer:
                 'total_count': total_count
             }
             
-            logger.debug(f"文本分析完成: {result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"文本分析完成: {result}")
             return result
             
         except Exception as e:
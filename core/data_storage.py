@@ -11,6 +11,8 @@ MVP版本专注于简单、可靠的数据持久化。
 
 import sqlite3
 import logging
+import threading
+import time
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional, Dict, List
@@ -20,34 +22,116 @@ logger = logging.getLogger(__name__)
 
 class DataStorage:
     """数据存储管理器 - MVP版本"""
-    
-    def __init__(self, db_path: str = None):
+
+    # SQL语句常量 - 复用同一字符串对象，命中sqlite3连接级语句缓存，免去重复解析
+    _SQL_UPSERT = '''
+        INSERT INTO daily_stats
+        (date, chinese_chars, english_chars, total_chars, total_keys, updated_at)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(date) DO UPDATE SET
+            chinese_chars = chinese_chars + excluded.chinese_chars,
+            english_chars = english_chars + excluded.english_chars,
+            total_chars = total_chars + excluded.total_chars,
+            total_keys = total_keys + excluded.total_keys,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+
+    _SQL_SELECT_DAY = '''
+        SELECT date, chinese_chars, english_chars, total_chars,
+               total_keys, created_at, updated_at
+        FROM daily_stats
+        WHERE date = ?
+    '''
+
+    _SQL_SELECT_RECENT = '''
+        SELECT date, chinese_chars, english_chars, total_chars, total_keys
+        FROM daily_stats
+        ORDER BY date DESC
+        LIMIT ?
+    '''
+
+    _SQL_SELECT_ALL = '''
+        SELECT date, chinese_chars, english_chars, total_chars,
+               total_keys, created_at, updated_at
+        FROM daily_stats
+        ORDER BY date DESC
+    '''
+
+    _SQL_DELETE_DAY = 'DELETE FROM daily_stats WHERE date = ?'
+
+    _SQL_SUMMARY = '''
+        SELECT
+            COUNT(*) as total_days,
+            SUM(chinese_chars) as total_chinese,
+            SUM(english_chars) as total_english,
+            SUM(total_chars) as total_chars,
+            SUM(total_keys) as total_keys,
+            AVG(chinese_chars) as avg_chinese,
+            AVG(english_chars) as avg_english,
+            MIN(date) as first_date,
+            MAX(date) as last_date
+        FROM daily_stats
+    '''
+
+    def __init__(self, db_path: str = None, flush_interval: float = 5.0):
         """
         初始化数据存储
-        
+
         Args:
             db_path (str): 数据库文件路径，如果为None则使用默认路径
+            flush_interval (float): 内存累积数据自动落盘的时间间隔（秒）
         """
         if db_path is None:
             # 使用默认数据目录
             self.db_path = Path("data") / "daily_stats.db"
         else:
             self.db_path = Path(db_path)
-        
+
         # 确保数据目录存在
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # 路径字符串只转换一次，后续不再做Path <-> str转换
+        self._db_path_str = str(self.db_path)
+
+        # 长连接 - 避免每次写入都重新打开连接并fsync
+        # check_same_thread=False: 监听线程写入、GUI线程读取共用此连接，由_db_lock串行化
+        self._conn = sqlite3.connect(
+            self._db_path_str, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+
+        # 复用的游标 - 所有语句经由同一游标执行（调用方都持有_db_lock）
+        self._cursor = self._conn.cursor()
+
+        # 连接与内存累积区的线程锁
+        self._db_lock = threading.Lock()
+
+        # 内存累积区：date -> [中文, 英文, 总字符, 总按键]，按flush_interval批量落盘
+        self._pending = {}
+
+        # 活跃日期的计数器引用 - 热路径几乎总是更新"今天"，缓存引用省去字典查找
+        self._active_date = None
+        self._active_counts = None
+
+        # 查询结果缓存：date -> 统计字典（'__summary__'为摘要），任何写入时整体失效
+        self._query_cache = {}
+        self._last_flush = time.monotonic()
+        self.flush_interval = flush_interval
+
         # 初始化数据库
         self._init_database()
-        
+
         logger.info(f"数据存储初始化完成，数据库路径: {self.db_path}")
-    
+
     def _init_database(self):
         """初始化数据库表结构"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
+            with self._db_lock:
+                cursor = self._cursor
+
                 # 创建每日统计表
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS daily_stats (
@@ -60,62 +144,142 @@ class DataStorage:
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
-                
-                # 创建更新时间触发器
+
+                # 覆盖索引：最近N天查询只需扫描索引，不回表
                 cursor.execute('''
-                    CREATE TRIGGER IF NOT EXISTS update_daily_stats_timestamp 
-                    AFTER UPDATE ON daily_stats 
-                    BEGIN
-                        UPDATE daily_stats SET updated_at = CURRENT_TIMESTAMP 
-                        WHERE date = NEW.date;
-                    END
+                    CREATE INDEX IF NOT EXISTS idx_daily_stats_recent
+                    ON daily_stats(date DESC, chinese_chars, english_chars,
+                                   total_chars, total_keys)
                 ''')
-                
-                conn.commit()
+
+                # 写路径已在UPSERT中内联设置updated_at，触发器只会让每次
+                # 更新多跑一条UPDATE语句，历史库中如存在则删除
+                cursor.execute(
+                    'DROP TRIGGER IF EXISTS update_daily_stats_timestamp'
+                )
+
                 logger.info("数据库表结构初始化完成")
-                
+
         except Exception as e:
             logger.error(f"数据库初始化失败: {e}")
             raise
-    
-    def update_daily_stats(self, chinese_count: int, english_count: int, 
+
+    def update_daily_stats(self, chinese_count: int, english_count: int,
                           target_date: str = None, total_keys: int = None):
         """
-        更新每日统计数据
-        
+        累加每日统计数据（增量语义）
+
+        传入的是自上次保存以来的增量，数据先累加到内存累积区，
+        按flush_interval定期批量落盘，使按键热路径只剩一次字典更新。
+
         Args:
-            chinese_count (int): 中文字符数
-            english_count (int): 英文字符数
+            chinese_count (int): 新增中文字符数
+            english_count (int): 新增英文字符数
             target_date (str): 目标日期，格式YYYY-MM-DD，默认今天
-            total_keys (int): 总按键数，可选
-            
+            total_keys (int): 新增按键数，可选
+
         Returns:
             bool: 操作是否成功
         """
         if target_date is None:
             target_date = date.today().strftime('%Y-%m-%d')
-        
+
         total_chars = chinese_count + english_count
-        
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 使用UPSERT操作（INSERT OR REPLACE）
-                cursor.execute('''
-                    INSERT OR REPLACE INTO daily_stats 
-                    (date, chinese_chars, english_chars, total_chars, total_keys, updated_at)
-                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (target_date, chinese_count, english_count, total_chars, total_keys))
-                
-                conn.commit()
-                
+            with self._db_lock:
+                self._query_cache.clear()
+
+                if target_date == self._active_date:
+                    counts = self._active_counts
+                else:
+                    counts = self._pending.get(target_date)
+                    if counts is None:
+                        counts = [0, 0, 0, 0]
+                        self._pending[target_date] = counts
+                    self._active_date = target_date
+                    self._active_counts = counts
+
+                counts[0] += chinese_count
+                counts[1] += english_count
+                counts[2] += total_chars
+                counts[3] += total_keys or 0
+
+            # 到达落盘间隔时批量写入
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"每日统计已更新: {target_date} - 中文:{chinese_count}, 英文:{english_count}")
-                return True
-                
+            return True
+
         except Exception as e:
             logger.error(f"更新每日统计失败: {e}")
             return False
+
+    def bulk_update_daily_stats(self, records: List[tuple]) -> bool:
+        """
+        批量导入多天统计数据（增量语义）
+
+        Args:
+            records (list): 记录列表，每条为 (date, chinese_count, english_count, total_keys)
+
+        Returns:
+            bool: 操作是否成功
+        """
+        if not records:
+            return True
+
+        try:
+            params = [
+                (target_date, chinese, english, chinese + english, total_keys or 0)
+                for target_date, chinese, english, total_keys in records
+            ]
+
+            with self._db_lock:
+                self._query_cache.clear()
+                # executemany让SQLite复用同一条预编译语句，整批一次提交
+                self._cursor.executemany(self._SQL_UPSERT, params)
+
+            logger.info(f"批量导入{len(records)}天统计数据完成")
+            return True
+
+        except Exception as e:
+            logger.error(f"批量导入统计数据失败: {e}")
+            return False
+
+    def flush(self) -> bool:
+        """
+        将内存累积的统计数据批量写入数据库
+
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            with self._db_lock:
+                if not self._pending:
+                    self._last_flush = time.monotonic()
+                    return True
+
+                for target_date, counts in self._pending.items():
+                    # 增量UPSERT：已有记录直接累加，省去读取-修改-写回的往返
+                    self._cursor.execute(
+                        self._SQL_UPSERT,
+                        (target_date, counts[0], counts[1], counts[2], counts[3])
+                    )
+
+                self._pending.clear()
+                # 活跃引用指向已清空的累积区，必须一并失效
+                self._active_date = None
+                self._active_counts = None
+                self._last_flush = time.monotonic()
+
+                logger.debug("内存累积数据已落盘")
+                return True
+
+        except Exception as e:
+            logger.error(f"数据落盘失败: {e}")
+            return False
     
     def get_daily_stats(self, target_date: str = None) -> Optional[Dict]:
         """
@@ -129,30 +293,24 @@ class DataStorage:
         """
         if target_date is None:
             target_date = date.today().strftime('%Y-%m-%d')
-        
+
+        # 先落盘，保证读到内存累积区中的最新数据
+        self.flush()
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT date, chinese_chars, english_chars, total_chars, 
-                           total_keys, created_at, updated_at
-                    FROM daily_stats 
-                    WHERE date = ?
-                ''', (target_date,))
-                
-                row = cursor.fetchone()
-                
+            with self._db_lock:
+                cached = self._query_cache.get(target_date)
+                if cached is not None:
+                    return dict(cached)
+
+                self._cursor.execute(self._SQL_SELECT_DAY, (target_date,))
+
+                row = self._cursor.fetchone()
+
                 if row:
-                    return {
-                        'date': row[0],
-                        'chinese_chars': row[1],
-                        'english_chars': row[2],
-                        'total_chars': row[3],
-                        'total_keys': row[4],
-                        'created_at': row[5],
-                        'updated_at': row[6]
-                    }
+                    result = dict(row)
+                    self._query_cache[target_date] = result
+                    return dict(result)
                 else:
                     logger.debug(f"日期 {target_date} 没有统计数据")
                     return None
@@ -167,36 +325,19 @@ class DataStorage:
         
         Args:
             days (int): 天数
-            
+
         Returns:
-            list: 统计数据列表，按日期倒序排列
+            list: 统计数据列表，按日期倒序排列（只含统计列，不含时间戳）
         """
+        self.flush()
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT date, chinese_chars, english_chars, total_chars, 
-                           total_keys, created_at, updated_at
-                    FROM daily_stats 
-                    ORDER BY date DESC 
-                    LIMIT ?
-                ''', (days,))
-                
-                rows = cursor.fetchall()
-                
-                result = []
-                for row in rows:
-                    result.append({
-                        'date': row[0],
-                        'chinese_chars': row[1],
-                        'english_chars': row[2],
-                        'total_chars': row[3],
-                        'total_keys': row[4],
-                        'created_at': row[5],
-                        'updated_at': row[6]
-                    })
-                
+            with self._db_lock:
+                # 只选覆盖索引中的列，查询走索引即可完成
+                self._cursor.execute(self._SQL_SELECT_RECENT, (days,))
+
+                result = [dict(row) for row in self._cursor.fetchall()]
+
                 logger.debug(f"获取最近{days}天数据，共{len(result)}条记录")
                 return result
                 
@@ -211,31 +352,14 @@ class DataStorage:
         Returns:
             list: 所有统计数据，按日期倒序排列
         """
+        self.flush()
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT date, chinese_chars, english_chars, total_chars, 
-                           total_keys, created_at, updated_at
-                    FROM daily_stats 
-                    ORDER BY date DESC
-                ''')
-                
-                rows = cursor.fetchall()
-                
-                result = []
-                for row in rows:
-                    result.append({
-                        'date': row[0],
-                        'chinese_chars': row[1],
-                        'english_chars': row[2],
-                        'total_chars': row[3],
-                        'total_keys': row[4],
-                        'created_at': row[5],
-                        'updated_at': row[6]
-                    })
-                
+            with self._db_lock:
+                self._cursor.execute(self._SQL_SELECT_ALL)
+
+                result = [dict(row) for row in self._cursor.fetchall()]
+
                 logger.debug(f"获取所有数据，共{len(result)}条记录")
                 return result
                 
@@ -253,14 +377,15 @@ class DataStorage:
         Returns:
             bool: 操作是否成功
         """
+        self.flush()
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('DELETE FROM daily_stats WHERE date = ?', (target_date,))
-                
-                if cursor.rowcount > 0:
-                    conn.commit()
+            with self._db_lock:
+                self._query_cache.clear()
+
+                self._cursor.execute(self._SQL_DELETE_DAY, (target_date,))
+
+                if self._cursor.rowcount > 0:
                     logger.info(f"已删除日期 {target_date} 的统计数据")
                     return True
                 else:
@@ -278,29 +403,21 @@ class DataStorage:
         Returns:
             dict: 摘要信息
         """
+        self.flush()
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
+            with self._db_lock:
+                cached = self._query_cache.get('__summary__')
+                if cached is not None:
+                    return dict(cached)
+
                 # 获取基本统计
-                cursor.execute('''
-                    SELECT 
-                        COUNT(*) as total_days,
-                        SUM(chinese_chars) as total_chinese,
-                        SUM(english_chars) as total_english,
-                        SUM(total_chars) as total_chars,
-                        SUM(total_keys) as total_keys,
-                        AVG(chinese_chars) as avg_chinese,
-                        AVG(english_chars) as avg_english,
-                        MIN(date) as first_date,
-                        MAX(date) as last_date
-                    FROM daily_stats
-                ''')
-                
-                row = cursor.fetchone()
+                self._cursor.execute(self._SQL_SUMMARY)
+
+                row = self._cursor.fetchone()
                 
                 if row and row[0] > 0:
-                    return {
+                    summary = {
                         'total_days': row[0],
                         'total_chinese': row[1] or 0,
                         'total_english': row[2] or 0,
@@ -311,6 +428,8 @@ class DataStorage:
                         'first_date': row[7],
                         'last_date': row[8]
                     }
+                    self._query_cache['__summary__'] = summary
+                    return dict(summary)
                 else:
                     return {
                         'total_days': 0,
@@ -329,10 +448,12 @@ class DataStorage:
             return {}
     
     def close(self):
-        """关闭数据库连接（备用方法）"""
-        # SQLite使用上下文管理器，不需要显式关闭
+        """关闭数据库连接（落盘剩余数据后关闭长连接）"""
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
         logger.info("数据存储已关闭")
-    
+
     def backup_database(self, backup_path: str = None) -> bool:
         """
         备份数据库
@@ -347,12 +468,28 @@ class DataStorage:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_path = self.db_path.parent / f"daily_stats_backup_{timestamp}.db"
         
+        self.flush()
+
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            # VACUUM INTO在一条语句内生成紧凑的一致性快照（含WAL中的数据）
+            with self._db_lock:
+                self._conn.execute('VACUUM INTO ?', (str(backup_path),))
             logger.info(f"数据库已备份到: {backup_path}")
             return True
-            
+
+        except sqlite3.OperationalError:
+            # 旧版SQLite不支持VACUUM INTO，回退到检查点+文件复制
+            try:
+                import shutil
+                with self._db_lock:
+                    self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                shutil.copy2(self.db_path, backup_path)
+                logger.info(f"数据库已备份到: {backup_path}")
+                return True
+            except Exception as e:
+                logger.error(f"数据库备份失败: {e}")
+                return False
+
         except Exception as e:
             logger.error(f"数据库备份失败: {e}")
             return False
@@ -362,44 +499,39 @@ class DataStorage:
 def test_data_storage():
     """测试数据存储功能"""
     print("🧪 测试数据存储...")
-    
-    # 创建测试数据库
-    storage = DataStorage("test_daily_stats.db")
-    
-    # 测试更新数据
-    today = date.today().strftime('%Y-%m-%d')
-    print(f"📅 测试日期: {today}")
-    
-    # 更新今日数据
-    if storage.update_daily_stats(100, 200, total_keys=350):
-        print("✅ 数据更新成功")
-    else:
-        print("❌ 数据更新失败")
-    
-    # 读取今日数据
-    stats = storage.get_daily_stats(today)
-    if stats:
-        print(f"📊 今日统计: 中文={stats['chinese_chars']}, 英文={stats['english_chars']}")
-    else:
-        print("❌ 读取数据失败")
-    
-    # 测试摘要
-    summary = storage.get_stats_summary()
-    print(f"📈 统计摘要: 总天数={summary.get('total_days', 0)}")
-    
-    # 测试最近数据
-    recent = storage.get_recent_stats(3)
-    print(f"📋 最近3天数据: {len(recent)}条记录")
-    
-    print("✅ 数据存储测试完成")
-    
-    # 清理测试文件
-    import os
+
+    # 创建测试数据库（:memory: - 无持久化需求，也无需清理文件）
+    storage = DataStorage(":memory:")
+
     try:
-        os.remove("test_daily_stats.db")
-        print("🗑️ 测试文件已清理")
-    except:
-        pass
+        # 测试更新数据
+        today = date.today().strftime('%Y-%m-%d')
+        print(f"📅 测试日期: {today}")
+
+        # 更新今日数据
+        if storage.update_daily_stats(100, 200, total_keys=350):
+            print("✅ 数据更新成功")
+        else:
+            print("❌ 数据更新失败")
+
+        # 读取今日数据
+        stats = storage.get_daily_stats(today)
+        if stats:
+            print(f"📊 今日统计: 中文={stats['chinese_chars']}, 英文={stats['english_chars']}")
+        else:
+            print("❌ 读取数据失败")
+
+        # 测试摘要
+        summary = storage.get_stats_summary()
+        print(f"📈 统计摘要: 总天数={summary.get('total_days', 0)}")
+
+        # 测试最近数据
+        recent = storage.get_recent_stats(3)
+        print(f"📋 最近3天数据: {len(recent)}条记录")
+
+        print("✅ 数据存储测试完成")
+    finally:
+        storage.close()
 
 
 if __name__ == "__main__":
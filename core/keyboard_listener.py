@@ -13,8 +13,10 @@ import threading
 import time
 import logging
 from datetime import datetime
-from pynput import keyboard
-from .character_analyzer import CharacterAnalyzer
+from .character_analyzer import CharacterAnalyzer, VECTORIZE_THRESHOLD
+
+# pynput在start_listening时才导入：其平台后端加载涉及ctypes扫描，
+# 开销可观，纯分析/存储场景（如quick_test）不该为此买单
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +24,41 @@ logger = logging.getLogger(__name__)
 class KeyboardListener:
     """键盘监听器 - MVP版本"""
     
-    def __init__(self, save_callback=None, save_interval=100):
+    def __init__(self, save_callback=None, save_interval=5.0,
+                 batch_size=VECTORIZE_THRESHOLD):
         """
         初始化键盘监听器
-        
+
         Args:
-            save_callback (callable): 数据保存回调函数，签名: (chinese_count, english_count)
-            save_interval (int): 每多少次按键保存一次数据
+            save_callback (callable): 数据保存回调函数，签名: (chinese_count, english_count)，
+                传入的是自上次保存以来的增量
+            save_interval (float): 数据保存的时间间隔（秒），按时间合并写入，
+                与打字速度无关
+            batch_size (int): 字符缓冲批量处理的大小，默认与分析器的
+                向量化阈值对齐，保证整批字符都走向量化分类路径
         """
         self.analyzer = CharacterAnalyzer()
         self.save_callback = save_callback
         self.save_interval = save_interval
-        
+        self.batch_size = batch_size
+
         # 统计计数器
         self.today_chinese = 0
         self.today_english = 0
         self.total_keys = 0
+
+        # 计数器的不可变快照 (中文, 英文, 总按键) - 写入方在锁内整体替换引用，
+        # 引用赋值在GIL下是原子的，读取方无需加锁即可拿到一致的三元组
+        self._counts = (0, 0, 0)
+
+        # 上次保存时的计数快照（保存回调只传递增量）
+        self._saved_chinese = 0
+        self._saved_english = 0
+        self._last_save_time = time.monotonic()
+
+        # 字符缓冲区 - 按键回调只做append，攒满一批后统一分类与计数
+        # （list.append在CPython下是原子操作，回调线程写入无需加锁）
+        self._char_buffer = []
         
         # 控制变量
         self.is_listening = False
@@ -57,31 +78,51 @@ class KeyboardListener:
             key: pynput键盘事件对象
         """
         try:
-            # 获取字符
-            char = None
-            if hasattr(key, 'char') and key.char:
-                char = key.char
-            
-            # 如果是有效字符，进行分析
+            # 获取字符 - getattr带默认值比hasattr+再取属性少一次属性探测
+            # （修饰键/功能键没有char属性，此函数每次物理按键都会执行）
+            char = getattr(key, 'char', None)
+
+            # 有效字符只追加到缓冲区，攒满一批再处理
             if char:
-                char_type = self.analyzer.classify_character(char)
-                
-                with self._lock:
-                    self.total_keys += 1
-                    
-                    if char_type == 'chinese':
-                        self.today_chinese += 1
-                        logger.debug(f"中文字符: '{char}' (总计: {self.today_chinese})")
-                    elif char_type == 'english':
-                        self.today_english += 1
-                        logger.debug(f"英文字符: '{char}' (总计: {self.today_english})")
-                    
-                    # 定期保存数据
-                    if self.total_keys % self.save_interval == 0:
-                        self._save_data()
-            
+                self._char_buffer.append(char)
+
+                if len(self._char_buffer) >= self.batch_size:
+                    self._process_buffer()
+
         except Exception as e:
             logger.warning(f"按键处理异常: {e}")
+
+    def _process_buffer(self):
+        """批量处理缓冲区中的字符：一次分类、一次加锁更新计数"""
+        # 缓冲区交换必须在锁内：批满回调（监听线程）、读数/强制保存
+        # （GUI线程）和停止收尾都会调用本方法，锁外交换会让两个线程
+        # 拿到同一批字符重复计数，还可能丢掉交换间隙追加的按键
+        with self._lock:
+            buffer, self._char_buffer = self._char_buffer, []
+        if not buffer:
+            return
+
+        batch = ''.join(buffer)
+        result = self.analyzer.analyze_text(batch)
+
+        with self._lock:
+            self.total_keys += len(batch)
+            self.today_chinese += result['chinese_count']
+            self.today_english += result['english_count']
+            self._counts = (self.today_chinese, self.today_english,
+                            self.total_keys)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"批量处理{len(batch)}个字符: "
+                    f"中文+{result['chinese_count']}, 英文+{result['english_count']}"
+                )
+
+            # 按时间间隔保存数据（打字再快也不会放大写入频率）
+            now = time.monotonic()
+            if now - self._last_save_time >= self.save_interval:
+                self._save_data()
+                self._last_save_time = now
     
     def on_key_release(self, key):
         """
@@ -94,11 +135,23 @@ class KeyboardListener:
         pass
     
     def _save_data(self):
-        """内部数据保存方法"""
+        """内部数据保存方法（只传递自上次保存以来的增量）
+
+        调用方必须持有self._lock：增量读取与快照更新必须原子完成，
+        否则两次并发保存会读到同一份增量并重复回调（增量语义下
+        重复写入会在数据库中累加成双倍计数）。
+        """
         if self.save_callback:
             try:
-                self.save_callback(self.today_chinese, self.today_english)
-                logger.debug(f"数据已保存: 中文={self.today_chinese}, 英文={self.today_english}")
+                delta_chinese = self.today_chinese - self._saved_chinese
+                delta_english = self.today_english - self._saved_english
+
+                if delta_chinese or delta_english:
+                    self.save_callback(delta_chinese, delta_english)
+                    self._saved_chinese = self.today_chinese
+                    self._saved_english = self.today_english
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"数据已保存: 中文增量={delta_chinese}, 英文增量={delta_english}")
             except Exception as e:
                 logger.error(f"数据保存失败: {e}")
     
@@ -109,9 +162,12 @@ class KeyboardListener:
             return False
         
         try:
+            # 延迟导入pynput，首次启动监听时才加载平台后端
+            from pynput import keyboard
+
             self.is_listening = True
             self.start_time = datetime.now()
-            
+
             # 创建监听器
             self.listener = keyboard.Listener(
                 on_press=self.on_key_press,
@@ -139,10 +195,15 @@ class KeyboardListener:
             
             if self.listener:
                 self.listener.stop()
+                # 有界join等待回调线程退出（join阻塞期间释放GIL，不拖慢其他线程），
+                # 确保最后一批按键先进缓冲区再做收尾保存
+                self.listener.join(timeout=1.0)
                 self.listener = None
-            
-            # 保存最后的数据
-            self._save_data()
+
+            # 处理缓冲区剩余字符并保存最后的数据
+            self._process_buffer()
+            with self._lock:
+                self._save_data()
             
             end_time = datetime.now()
             duration = end_time - self.start_time if self.start_time else None
@@ -163,28 +224,42 @@ class KeyboardListener:
         Returns:
             dict: 当前统计信息
         """
-        with self._lock:
-            return {
-                'chinese_count': self.today_chinese,
-                'english_count': self.today_english,
-                'total_count': self.today_chinese + self.today_english,
-                'total_keys': self.total_keys,
-                'is_listening': self.is_listening,
-                'start_time': self.start_time,
-                'uptime': datetime.now() - self.start_time if self.start_time else None
-            }
+        # 先消化缓冲区，保证读数是最新的
+        self._process_buffer()
+
+        # 无锁读取：一次引用读取拿到一致的计数快照（写入方在锁内整体替换），
+        # GUI线程刷新读数时完全不会阻塞监听线程
+        chinese, english, total_keys = self._counts
+        is_listening = self.is_listening
+        start_time = self.start_time
+
+        return {
+            'chinese_count': chinese,
+            'english_count': english,
+            'total_count': chinese + english,
+            'total_keys': total_keys,
+            'is_listening': is_listening,
+            'start_time': start_time,
+            'uptime': datetime.now() - start_time if start_time else None
+        }
     
     def reset_daily_stats(self):
         """重置每日统计（新的一天开始时调用）"""
+        # 锁内只做计数器清零，日志输出放到锁外
         with self._lock:
             old_chinese = self.today_chinese
             old_english = self.today_english
-            
+
             self.today_chinese = 0
             self.today_english = 0
             self.total_keys = 0
-            
-            logger.info(f"每日统计已重置，前一天统计: 中文={old_chinese}, 英文={old_english}")
+            self._counts = (0, 0, 0)
+            self._saved_chinese = 0
+            self._saved_english = 0
+            self._last_save_time = time.monotonic()
+            self._char_buffer = []
+
+        logger.info(f"每日统计已重置，前一天统计: 中文={old_chinese}, 英文={old_english}")
     
     def set_save_callback(self, callback):
         """设置数据保存回调函数"""
@@ -193,7 +268,9 @@ class KeyboardListener:
     
     def force_save(self):
         """强制保存当前数据"""
-        self._save_data()
+        self._process_buffer()
+        with self._lock:
+            self._save_data()
         logger.info("强制保存数据完成")
 
 
@@ -206,21 +283,21 @@ class KeyboardListenerManager:
         self.is_running = False
         logger.info("键盘监听器管理器初始化完成")
     
-    def create_listener(self, save_callback=None, save_interval=100):
+    def create_listener(self, save_callback=None, save_interval=5.0):
         """
         创建键盘监听器实例
-        
+
         Args:
             save_callback: 数据保存回调
-            save_interval: 保存间隔
-            
+            save_interval: 保存时间间隔（秒）
+
         Returns:
             KeyboardListener: 监听器实例
         """
         self.listener = KeyboardListener(save_callback, save_interval)
         return self.listener
     
-    def start(self, save_callback=None, save_interval=100):
+    def start(self, save_callback=None, save_interval=5.0):
         """启动监听器"""
         if self.is_running:
             logger.warning("管理器已在运行中")
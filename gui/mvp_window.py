@@ -16,6 +16,7 @@ from tkinter import ttk, messagebox
 import threading
 import logging
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
 import sys
 
@@ -29,6 +30,12 @@ from utils.autostart import AutoStartManager
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _fmt(n):
+    """千分位格式化（带缓存 - 计数每2秒只变化很小的增量，重复值命中率高）"""
+    return f"{n:,}"
+
+
 class MVPWindow:
     """MVP版本主窗口"""
     
@@ -52,6 +59,15 @@ class MVPWindow:
             'total_count': 0
         }
         
+        # 各界面变量上次写入的内容快照 - 内容没变化的变量跳过写入（脏标记）
+        self._last_render = (None, None, None)
+
+        # 数据库查询是否在后台进行中（避免重复派发）
+        self._db_query_inflight = False
+
+        # 今日日期字符串缓存 - 2秒刷新循环无需每次strftime
+        self._today_cache = (None, '')
+
         # 创建界面
         self._create_widgets()
         
@@ -260,7 +276,7 @@ class MVPWindow:
         try:
             return self.listener_manager.start(
                 save_callback=self._on_data_save,
-                save_interval=50  # MVP版本更频繁保存
+                save_interval=5.0  # MVP版本更频繁保存（秒）
             )
         except Exception as e:
             logger.error(f"启动监听失败: {e}")
@@ -309,7 +325,7 @@ class MVPWindow:
                     self.listener_manager.listener.reset_daily_stats()
                 
                 # 清空数据库中的今日数据
-                today = date.today().strftime('%Y-%m-%d')
+                today = self._today_str()
                 self.data_storage.delete_daily_stats(today)
                 
                 self.status_var.set("📱 状态: 今日数据已重置")
@@ -322,7 +338,8 @@ class MVPWindow:
     def _setup_autostart(self):
         """设置自启动"""
         try:
-            self.autostart_manager.setup_autostart_with_prompt()
+            # 复用主窗口的Tk环境，提示框不再新建Tcl解释器
+            self.autostart_manager.setup_autostart_with_prompt(parent=self.root)
         except Exception as e:
             logger.error(f"自启动设置失败: {e}")
             messagebox.showerror("错误", f"自启动设置失败: {e}")
@@ -341,9 +358,9 @@ class MVPWindow:
             if stats:
                 result_text = (
                     f"📅 {query_date} 统计:\n"
-                    f"中文字符: {stats['chinese_chars']:,}\n"
-                    f"英文字符: {stats['english_chars']:,}\n"
-                    f"总计: {stats['total_chars']:,}\n"
+                    f"中文字符: {_fmt(stats['chinese_chars'])}\n"
+                    f"英文字符: {_fmt(stats['english_chars'])}\n"
+                    f"总计: {_fmt(stats['total_chars'])}\n"
                     f"更新时间: {stats.get('updated_at', 'N/A')}"
                 )
                 self.query_result_var.set(result_text)
@@ -356,28 +373,37 @@ class MVPWindow:
             logger.error(f"查询数据失败: {e}")
             messagebox.showerror("错误", f"查询失败: {e}")
     
+    def _today_str(self):
+        """返回今日日期字符串（跨天时才重新格式化）"""
+        today = date.today()
+        if today != self._today_cache[0]:
+            self._today_cache = (today, today.strftime('%Y-%m-%d'))
+        return self._today_cache[1]
+
     def _update_display(self):
-        """更新界面显示"""
+        """更新界面显示（内容无变化时跳过所有StringVar写入）"""
         try:
-            # 获取当前统计
+            # 先计算出要显示的文本（None表示该项保持现状）
+            stats_text = None
+            summary_text = None
+            uptime_text = None
+
             if self.is_monitoring and self.listener_manager.listener:
                 stats = self.listener_manager.get_stats()
-                
-                # 更新今日统计显示
+
                 stats_text = (
-                    f"今日统计 ({date.today().strftime('%Y-%m-%d')}):\n"
-                    f"中文字符: {stats['chinese_count']:,}\n"
-                    f"英文字符: {stats['english_count']:,}\n"
-                    f"总计: {stats['total_count']:,}\n"
-                    f"总按键: {stats['total_keys']:,}"
+                    f"今日统计 ({self._today_str()}):\n"
+                    f"中文字符: {_fmt(stats['chinese_count'])}\n"
+                    f"英文字符: {_fmt(stats['english_count'])}\n"
+                    f"总计: {_fmt(stats['total_count'])}\n"
+                    f"总按键: {_fmt(stats['total_keys'])}"
                 )
-                self.stats_var.set(stats_text)
-                
-                # 更新摘要信息
+
+                # 摘要信息
                 if stats['total_count'] > 0:
                     chinese_ratio = stats['chinese_count'] / stats['total_count'] * 100
                     summary_text = f"中英文比例: {chinese_ratio:.1f}% : {100-chinese_ratio:.1f}%"
-                    
+
                     # AI率简单评估
                     if stats['total_count'] > 1000:
                         ai_hint = " | 输出量较高，人工输出较多 💪"
@@ -385,34 +411,80 @@ class MVPWindow:
                         ai_hint = " | 输出量中等，正常工作状态 😊"
                     else:
                         ai_hint = " | 输出量较低，可能AI辅助较多 🤖"
-                    
-                    self.summary_var.set(summary_text + ai_hint)
+
+                    summary_text += ai_hint
                 else:
-                    self.summary_var.set("今日尚未开始输入...")
-                
-                # 更新运行时间
+                    summary_text = "今日尚未开始输入..."
+
+                # 运行时间
                 if stats['uptime']:
                     uptime_str = str(stats['uptime']).split('.')[0]  # 去掉微秒
-                    self.uptime_var.set(f"运行时间: {uptime_str}")
-                
+                    uptime_text = f"运行时间: {uptime_str}"
+
             else:
-                # 从数据库获取今日统计
-                today_stats = self.data_storage.get_daily_stats()
-                if today_stats:
-                    stats_text = (
-                        f"今日统计 ({date.today().strftime('%Y-%m-%d')}):\n"
-                        f"中文字符: {today_stats['chinese_chars']:,}\n"
-                        f"英文字符: {today_stats['english_chars']:,}\n"
-                        f"总计: {today_stats['total_chars']:,}"
-                    )
-                    self.stats_var.set(stats_text)
-                else:
-                    self.stats_var.set("今日尚未开始统计...")
-                    self.summary_var.set("")
-                    self.uptime_var.set("")
-                
+                # 数据库读取放到后台线程，避免阻塞Tk事件循环
+                self._refresh_db_stats_async()
+                return
+
+            self._apply_render(stats_text, summary_text, uptime_text)
+
         except Exception as e:
             logger.warning(f"更新显示失败: {e}")
+
+    def _refresh_db_stats_async(self):
+        """在后台线程查询今日统计，完成后回到Tk线程渲染"""
+        if self._db_query_inflight:
+            return
+        self._db_query_inflight = True
+
+        def worker():
+            try:
+                today_stats = self.data_storage.get_daily_stats()
+            except Exception as e:
+                logger.warning(f"后台查询今日统计失败: {e}")
+                today_stats = None
+            # 渲染必须回到Tk线程执行
+            self.root.after(0, self._render_db_stats, today_stats)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _render_db_stats(self, today_stats):
+        """渲染后台查询到的今日统计（Tk线程回调）"""
+        self._db_query_inflight = False
+
+        if today_stats:
+            stats_text = (
+                f"今日统计 ({self._today_str()}):\n"
+                f"中文字符: {_fmt(today_stats['chinese_chars'])}\n"
+                f"英文字符: {_fmt(today_stats['english_chars'])}\n"
+                f"总计: {_fmt(today_stats['total_chars'])}"
+            )
+            summary_text = None
+            uptime_text = None
+        else:
+            stats_text = "今日尚未开始统计..."
+            summary_text = ""
+            uptime_text = ""
+
+        self._apply_render(stats_text, summary_text, uptime_text)
+
+    def _apply_render(self, stats_text, summary_text, uptime_text):
+        """带脏标记地写入界面变量（None表示该项保持现状）
+
+        每个StringVar.set都会触发一次Tk事件和重布局，因此按变量逐项
+        比对上次写入的内容，只写真正变化的那几个，而不是一变全写。
+        """
+        last_stats, last_summary, last_uptime = self._last_render
+        if stats_text is not None and stats_text != last_stats:
+            self.stats_var.set(stats_text)
+            last_stats = stats_text
+        if summary_text is not None and summary_text != last_summary:
+            self.summary_var.set(summary_text)
+            last_summary = summary_text
+        if uptime_text is not None and uptime_text != last_uptime:
+            self.uptime_var.set(uptime_text)
+            last_uptime = uptime_text
+        self._last_render = (last_stats, last_summary, last_uptime)
     
     def _start_update_timer(self):
         """启动定时更新"""
@@ -10,7 +10,6 @@
 """
 
 import sys
-import os
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -33,20 +32,17 @@ def quick_test():
         print(f"❌ 字符分析器异常: {e}")
         return False
     
-    # 测试数据存储
+    # 测试数据存储（:memory:数据库 - 无持久化需求，也无需清理文件）
     try:
         from core.data_storage import DataStorage
-        storage = DataStorage("test_quick.db")
-        storage.update_daily_stats(10, 20)
-        stats = storage.get_daily_stats()
-        print(f"✅ 数据存储工作正常")
-        print(f"   今日统计: 中文={stats['chinese_chars']}, 英文={stats['english_chars']}")
-        
-        # 清理测试文件
+        storage = DataStorage(":memory:")
         try:
-            os.remove("test_quick.db")
-        except:
-            pass
+            storage.update_daily_stats(10, 20)
+            stats = storage.get_daily_stats()
+            print(f"✅ 数据存储工作正常")
+            print(f"   今日统计: 中文={stats['chinese_chars']}, 英文={stats['english_chars']}")
+        finally:
+            storage.close()
     except Exception as e:
         print(f"❌ 数据存储异常: {e}")
         return False
@@ -1,139 +1,142 @@
 #!/usr/bin/env python3
 """
 简单测试脚本 - 不依赖外部库的基础功能测试
+
+两种运行方式：
+- 直接运行: python simple_test.py （带汇总输出的自检）
+- pytest收集: pytest （配置见pytest.ini，已禁用cacheprovider避免缓存I/O）
+
+检查项全部用断言表达，失败时直接携带断言信息；
+逐行print的详细输出已移除，避免每行一次的stdout刷新开销。
 """
 
 import sys
-import os
-from pathlib import Path
+from importlib import import_module
+from importlib.util import find_spec
+
+# 依赖探测：find_spec只查找模块不执行导入，比捕获ImportError再做
+# 字符串匹配便宜，也不依赖异常消息的措辞
+HAS_PYNPUT = find_spec("pynput") is not None
+
+# 被测模块在模块加载时统一导入一次并缓存，各检查项共享同一批模块对象，
+# 不再每个检查函数各自触发一遍import机制（GUI模块除外，它依赖pynput）
+_MODULE_NAMES = (
+    "core.character_analyzer",
+    "core.data_storage",
+    "core.keyboard_listener",
+    "utils.autostart",
+)
+_MODULES = {name: import_module(name) for name in _MODULE_NAMES}
+
+
+def _check_character_analyzer():
+    """字符分析器冒烟检查 (不依赖外部库)"""
+    analyzer = _MODULES["core.character_analyzer"].CharacterAnalyzer()
+
+    # 单字符分类
+    assert analyzer.classify_character('你') == 'chinese'
+    assert analyzer.classify_character('h') == 'english'
+    assert analyzer.classify_character('1') == 'other'
+
+    # 文本分析
+    result = analyzer.analyze_text("hello你好123")
+    assert result['chinese_count'] == 2, result
+    assert result['english_count'] == 5, result
+    assert result['other_count'] == 3, result
+
+
+def _check_data_storage():
+    """数据存储冒烟检查 (SQLite是内置的)
+
+    使用:memory:数据库 - 冒烟测试没有持久化需求，
+    内存库省掉建文件、写日志和fsync，也无需清理文件。
+    """
+    storage = _MODULES["core.data_storage"].DataStorage(":memory:")
 
-def test_basic_imports():
-    """测试基础模块导入"""
-    print("🧪 测试基础模块导入...")
-    
-    try:
-        # 测试字符分析器 (不依赖外部库)
-        from core.character_analyzer import CharacterAnalyzer
-        analyzer = CharacterAnalyzer()
-        
-        # 测试字符分类
-        result1 = analyzer.classify_character('你')
-        result2 = analyzer.classify_character('h')
-        result3 = analyzer.classify_character('1')
-        
-        print(f"✅ 字符分析器正常: '你'→{result1}, 'h'→{result2}, '1'→{result3}")
-        
-        # 测试文本分析
-        text_result = analyzer.analyze_text("hello你好123")
-        print(f"✅ 文本分析正常: {text_result}")
-        
-    except Exception as e:
-        print(f"❌ 字符分析器测试失败: {e}")
-        return False
-    
     try:
-        # 测试数据存储 (SQLite是内置的)
-        from core.data_storage import DataStorage
-        storage = DataStorage("simple_test.db")
-        
-        # 测试数据保存
-        success = storage.update_daily_stats(10, 20)
-        print(f"✅ 数据存储正常: 保存结果={success}")
-        
-        # 测试数据读取
+        assert storage.update_daily_stats(10, 20) is True
+
         stats = storage.get_daily_stats()
-        if stats:
-            print(f"✅ 数据读取正常: 中文={stats['chinese_chars']}, 英文={stats['english_chars']}")
-        
-        # 清理测试文件
-        try:
-            os.remove("simple_test.db")
-        except:
-            pass
-            
-    except Exception as e:
-        print(f"❌ 数据存储测试失败: {e}")
-        return False
-    
-    try:
-        # 测试自启动模块 (winreg是内置的)
-        from utils.autostart import AutoStart
-        autostart = AutoStart()
-        status = autostart.get_status_info()
-        print(f"✅ 自启动模块正常: 支持={status['supported']}")
-        
-    except Exception as e:
-        print(f"❌ 自启动模块测试失败: {e}")
-        return False
-    
-    return True
+        assert stats is not None
+        assert stats['chinese_chars'] == 10, stats
+        assert stats['english_chars'] == 20, stats
+    finally:
+        storage.close()
+
+
+def _check_autostart():
+    """自启动模块冒烟检查 (winreg是内置的)"""
+    autostart = _MODULES["utils.autostart"].AutoStart()
+    status = autostart.get_status_info()
+    assert isinstance(status['supported'], bool)
+    assert 'enabled' in status and 'message' in status
+
+
+# 基础检查表：名称 -> 冒烟检查函数，统一走同一套检查流程
+_BASIC_CHECKS = (
+    ("字符分析器", _check_character_analyzer),
+    ("数据存储", _check_data_storage),
+    ("自启动模块", _check_autostart),
+)
+
+
+def test_basic_imports():
+    """测试基础模块导入（表驱动，断言失败即测试失败）"""
+    for name, check in _BASIC_CHECKS:
+        check()
+
+
+def test_keyboard_listener_import():
+    """测试键盘监听器导入（pynput本身延迟到start_listening才加载）"""
+    listener_module = _MODULES["core.keyboard_listener"]
+    assert hasattr(listener_module, 'KeyboardListenerManager')
+
 
 def test_gui_import():
     """测试GUI模块导入 (不启动)"""
-    print("\n🖥️ 测试GUI模块导入...")
-    
-    try:
-        # 只测试导入，不启动GUI
-        from gui.mvp_window import MVPWindow
-        print("✅ GUI模块导入成功")
-        return True
-        
-    except Exception as e:
-        print(f"❌ GUI模块导入失败: {e}")
-        # 检查是否是因为缺少pynput
-        if "pynput" in str(e):
-            print("⚠️ 可能是因为缺少pynput依赖")
-        return False
+    if not HAS_PYNPUT:
+        # pytest下显式报skipped而不是passed；直接运行main()时没有
+        # pytest运行时，退化为静默跳过
+        if "pytest" in sys.modules:
+            import pytest
+            pytest.skip("缺少pynput依赖，跳过GUI导入检查")
+        return
+
+    from gui.mvp_window import MVPWindow
+    assert MVPWindow is not None
 
-def test_keyboard_listener_import():
-    """测试键盘监听器导入"""
-    print("\n⌨️ 测试键盘监听器导入...")
-    
-    try:
-        # 尝试导入键盘监听器
-        from core.keyboard_listener import KeyboardListenerManager
-        print("✅ 键盘监听器模块导入成功")
-        return True
-        
-    except ImportError as e:
-        print(f"❌ 键盘监听器导入失败: {e}")
-        if "pynput" in str(e):
-            print("⚠️ 缺少pynput依赖，无法使用键盘监听功能")
-        return False
-    except Exception as e:
-        print(f"❌ 键盘监听器异常: {e}")
-        return False
 
 def main():
-    """主测试函数"""
+    """主测试函数（直接运行时输出汇总结果）"""
     print("🚀 DailyInputCounter 简单测试")
     print("=" * 40)
-    
-    # 测试基础功能 (不依赖外部库)
-    basic_ok = test_basic_imports()
-    
-    # 测试键盘监听器导入
-    keyboard_ok = test_keyboard_listener_import()
-    
-    # 测试GUI导入
-    gui_ok = test_gui_import()
-    
-    print("\n" + "=" * 40)
+
+    results = {}
+    for label, test in (("基础功能", test_basic_imports),
+                        ("键盘监听", test_keyboard_listener_import),
+                        ("GUI模块", test_gui_import)):
+        try:
+            test()
+            results[label] = True
+        except Exception as e:
+            results[label] = False
+            print(f"❌ {label}异常: {e}")
+
     print("📊 测试结果:")
-    print(f"  基础功能: {'✅ 正常' if basic_ok else '❌ 异常'}")
-    print(f"  键盘监听: {'✅ 正常' if keyboard_ok else '❌ 异常 (可能缺少pynput)'}")
-    print(f"  GUI模块: {'✅ 正常' if gui_ok else '❌ 异常'}")
-    
-    if basic_ok:
+    for label, ok in results.items():
+        print(f"  {label}: {'✅ 正常' if ok else '❌ 异常'}")
+
+    if results["基础功能"]:
         print("\n🎉 核心功能正常，可以进行基础数据分析！")
-        if keyboard_ok and gui_ok:
+        if results["键盘监听"] and results["GUI模块"] and HAS_PYNPUT:
             print("🚀 所有功能正常，可以启动完整应用！")
-        else:
+        elif not HAS_PYNPUT:
             print("⚠️ 完整功能需要安装依赖: pip install pynput")
     else:
         print("\n❌ 基础功能异常，请检查代码")
-    
-    return basic_ok
+
+    return results["基础功能"]
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -16,6 +16,15 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Windows专用模块在加载时导入一次并绑定为模块级名字，
+# 避免每次enable/disable/is_enabled调用都重新走一遍import机制
+if os.name == 'nt':
+    import ctypes
+    import winreg as reg
+else:
+    ctypes = None
+    reg = None
+
 
 class AutoStart:
     """Windows自启动管理器 - MVP版本"""
@@ -27,6 +36,11 @@ class AutoStart:
     def __init__(self):
         """初始化自启动管理器"""
         self.is_windows = os.name == 'nt'
+
+        # 自启动状态缓存（None表示未知）- 注册表查询是系统调用级开销，
+        # GUI轮询状态时直接命中缓存，仅在enable/disable后更新
+        self._enabled_cache = None
+
         logger.info("自启动管理器初始化完成")
     
     @staticmethod
@@ -34,147 +48,143 @@ class AutoStart:
         """检查是否具有管理员权限"""
         if os.name == 'nt':
             try:
-                import ctypes
                 return ctypes.windll.shell32.IsUserAnAdmin()
             except:
                 return False
         return True
     
+    # 程序路径缓存 - sys.executable和__file__在进程内不变，只需计算一次
+    _exe_path_cache = None
+
     @staticmethod
     def get_exe_path():
-        """获取当前程序路径"""
-        if getattr(sys, 'frozen', False):
-            # 如果是打包的exe文件
-            return sys.executable
-        else:
-            # 如果是Python脚本
-            main_py = Path(__file__).parent.parent / "main.py"
-            python_exe = sys.executable
-            return f'"{python_exe}" "{main_py}"'
+        """获取当前程序路径（首次调用后缓存）"""
+        if AutoStart._exe_path_cache is None:
+            if getattr(sys, 'frozen', False):
+                # 如果是打包的exe文件
+                AutoStart._exe_path_cache = sys.executable
+            else:
+                # 如果是Python脚本
+                main_py = Path(__file__).parent.parent / "main.py"
+                python_exe = sys.executable
+                AutoStart._exe_path_cache = f'"{python_exe}" "{main_py}"'
+        return AutoStart._exe_path_cache
     
-    def enable(self):
-        """启用开机自启动"""
+    def _op(self, action):
+        """注册表操作统一入口（action: 'enable' | 'disable' | 'query'）
+
+        三种操作共用同一套开键/关键与异常处理流程，
+        状态缓存的更新也集中在这一处。
+        """
         if not self.is_windows:
-            logger.warning("非Windows系统，不支持注册表自启动")
+            if action != 'query':
+                logger.warning("非Windows系统，不支持注册表自启动")
             return False
-        
+
+        access = reg.KEY_READ if action == 'query' else reg.KEY_SET_VALUE
         try:
-            import winreg as reg
-            
-            # 获取程序路径
-            exe_path = self.get_exe_path()
-            
-            # 打开注册表键
             key = reg.OpenKey(
-                reg.HKEY_CURRENT_USER, 
-                self.REGISTRY_PATH, 
-                0, 
-                reg.KEY_SET_VALUE
+                reg.HKEY_CURRENT_USER, self.REGISTRY_PATH, 0, access
             )
-            
-            # 设置启动项
-            reg.SetValueEx(
-                key, 
-                self.APP_NAME, 
-                0, 
-                reg.REG_SZ, 
-                exe_path
-            )
-            
-            # 关闭注册表键
-            reg.CloseKey(key)
-            
-            logger.info(f"自启动已启用: {exe_path}")
-            return True
-            
-        except ImportError:
-            logger.error("winreg模块不可用")
-            return False
+            try:
+                if action == 'enable':
+                    exe_path = self.get_exe_path()
+                    reg.SetValueEx(key, self.APP_NAME, 0, reg.REG_SZ, exe_path)
+                    self._enabled_cache = True
+                    logger.info(f"自启动已启用: {exe_path}")
+                    return True
+
+                if action == 'disable':
+                    try:
+                        reg.DeleteValue(key, self.APP_NAME)
+                        logger.info("自启动已禁用")
+                    except FileNotFoundError:
+                        logger.info("自启动项不存在，无需删除")
+                    self._enabled_cache = False
+                    return True
+
+                # query
+                try:
+                    value, _ = reg.QueryValueEx(key, self.APP_NAME)
+                    self._enabled_cache = True
+                    logger.debug(f"自启动状态: 已启用 ({value})")
+                except FileNotFoundError:
+                    self._enabled_cache = False
+                    logger.debug("自启动状态: 未启用")
+                return self._enabled_cache
+            finally:
+                reg.CloseKey(key)
+
         except Exception as e:
-            logger.error(f"启用自启动失败: {e}")
+            self._enabled_cache = None
+            logger.error(f"自启动注册表操作失败({action}): {e}")
             return False
-    
+
+    def enable(self):
+        """启用开机自启动"""
+        return self._op('enable')
+
     def disable(self):
         """禁用开机自启动"""
+        return self._op('disable')
+
+    def is_enabled(self):
+        """检查是否已启用自启动（结果带缓存，enable/disable后自动更新）"""
         if not self.is_windows:
-            logger.warning("非Windows系统，不支持注册表自启动")
-            return False
-        
-        try:
-            import winreg as reg
-            
-            # 打开注册表键
-            key = reg.OpenKey(
-                reg.HKEY_CURRENT_USER, 
-                self.REGISTRY_PATH, 
-                0, 
-                reg.KEY_SET_VALUE
-            )
-            
-            # 删除启动项
-            try:
-                reg.DeleteValue(key, self.APP_NAME)
-                logger.info("自启动已禁用")
-                result = True
-            except FileNotFoundError:
-                logger.info("自启动项不存在，无需删除")
-                result = True
-            
-            # 关闭注册表键
-            reg.CloseKey(key)
-            
-            return result
-            
-        except ImportError:
-            logger.error("winreg模块不可用")
-            return False
-        except Exception as e:
-            logger.error(f"禁用自启动失败: {e}")
             return False
-    
-    def is_enabled(self):
-        """检查是否已启用自启动"""
+
+        # 命中缓存时不走注册表查询
+        if self._enabled_cache is not None:
+            return self._enabled_cache
+
+        return self._op('query')
+
+    def toggle(self):
+        """切换自启动状态
+
+        探测与写入共用同一个注册表键句柄，整个切换只打开一次键，
+        而不是is_enabled/enable/disable各开各的。
+        """
         if not self.is_windows:
+            logger.warning("非Windows系统，不支持注册表自启动")
             return False
-        
+
         try:
-            import winreg as reg
-            
-            # 打开注册表键
+            # 读写权限一次打开，探测和修改共用句柄
             key = reg.OpenKey(
-                reg.HKEY_CURRENT_USER, 
-                self.REGISTRY_PATH, 
-                0, 
-                reg.KEY_READ
+                reg.HKEY_CURRENT_USER,
+                self.REGISTRY_PATH,
+                0,
+                reg.KEY_READ | reg.KEY_SET_VALUE
             )
-            
-            # 查询启动项
+
             try:
-                value, _ = reg.QueryValueEx(key, self.APP_NAME)
-                reg.CloseKey(key)
-                
-                logger.debug(f"自启动状态: 已启用 ({value})")
+                try:
+                    reg.QueryValueEx(key, self.APP_NAME)
+                    enabled = True
+                except FileNotFoundError:
+                    enabled = False
+
+                if enabled:
+                    reg.DeleteValue(key, self.APP_NAME)
+                    self._enabled_cache = False
+                    logger.info("自启动已禁用")
+                else:
+                    reg.SetValueEx(
+                        key, self.APP_NAME, 0, reg.REG_SZ, self.get_exe_path()
+                    )
+                    self._enabled_cache = True
+                    logger.info("自启动已启用")
+
                 return True
-                
-            except FileNotFoundError:
+            finally:
                 reg.CloseKey(key)
-                logger.debug("自启动状态: 未启用")
-                return False
-            
-        except ImportError:
-            logger.error("winreg模块不可用")
-            return False
+
         except Exception as e:
-            logger.error(f"检查自启动状态失败: {e}")
+            self._enabled_cache = None
+            logger.error(f"切换自启动状态失败: {e}")
             return False
     
-    def toggle(self):
-        """切换自启动状态"""
-        if self.is_enabled():
-            return self.disable()
-        else:
-            return self.enable()
-    
     def get_status_info(self):
         """获取自启动状态信息"""
         if not self.is_windows:
@@ -204,42 +214,57 @@ class AutoStartManager:
         self.autostart = AutoStart()
         logger.info("自启动管理器初始化完成")
     
-    def setup_autostart_with_prompt(self):
-        """带用户提示的自启动设置"""
+    def setup_autostart_with_prompt(self, parent=None):
+        """带用户提示的自启动设置
+
+        Args:
+            parent: 已存在的Tk窗口。GUI调用时传入主窗口复用其Tk环境，
+                避免每次弹提示都重新初始化一个Tcl解释器（百毫秒级开销）
+        """
         try:
-            import tkinter as tk
             from tkinter import messagebox
-            
-            # 隐藏主窗口
-            root = tk.Tk()
-            root.withdraw()
-            
+
+            # 没有现成窗口时才临时创建隐藏的Tk根窗口
+            root = None
+            if parent is None:
+                import tkinter as tk
+                root = tk.Tk()
+                root.withdraw()
+
+            owner = parent if parent is not None else root
+
             # 检查当前状态
             if self.autostart.is_enabled():
                 result = messagebox.askyesno(
                     "自启动设置",
-                    "检测到已启用开机自启动。\n\n是否要禁用开机自启动？"
+                    "检测到已启用开机自启动。\n\n是否要禁用开机自启动？",
+                    parent=owner
                 )
                 if result:
                     success = self.autostart.disable()
                     if success:
-                        messagebox.showinfo("成功", "开机自启动已禁用！")
+                        messagebox.showinfo("成功", "开机自启动已禁用！", parent=owner)
                     else:
-                        messagebox.showerror("失败", "禁用开机自启动失败！")
+                        messagebox.showerror("失败", "禁用开机自启动失败！", parent=owner)
             else:
                 result = messagebox.askyesno(
                     "自启动设置",
-                    "是否要启用开机自启动？\n\n启用后程序将在系统启动时自动运行。"
+                    "是否要启用开机自启动？\n\n启用后程序将在系统启动时自动运行。",
+                    parent=owner
                 )
                 if result:
                     success = self.autostart.enable()
                     if success:
-                        messagebox.showinfo("成功", "开机自启动已启用！")
+                        messagebox.showinfo("成功", "开机自启动已启用！", parent=owner)
                     else:
-                        messagebox.showerror("失败", "启用开机自启动失败！\n可能需要管理员权限。")
-            
-            root.destroy()
-            
+                        messagebox.showerror(
+                            "失败", "启用开机自启动失败！\n可能需要管理员权限。",
+                            parent=owner
+                        )
+
+            if root is not None:
+                root.destroy()
+
         except Exception as e:
             logger.error(f"自启动设置界面失败: {e}")
     